@@ -0,0 +1,15 @@
+import pytest
+
+from mysite.runner import disconnect_post_migrate_handlers
+
+
+@pytest.fixture(scope='session')
+def django_db_modify_db_settings(django_db_modify_db_settings_parallel_suffix):
+    """
+    pytest-django's hook that runs just before django_db_setup creates the test database, overridden
+    to skip the ContentType and Permission rows, as mysite.runner.TestRunner does for manage.py test.
+
+    Keep the django_db_modify_db_settings_parallel_suffix dependency: it gives each pytest-xdist
+    worker its own database name.
+    """
+    disconnect_post_migrate_handlers()
@@ -0,0 +1,20 @@
+from django.contrib.auth.management import create_permissions
+from django.contrib.contenttypes.management import create_contenttypes
+from django.db.models.signals import post_migrate
+from django.test.runner import DiscoverRunner
+
+
+def disconnect_post_migrate_handlers():
+    """
+    Stop the test database creation from filling the ContentType and Permission tables, which the
+    tests never query.
+    """
+    post_migrate.disconnect(create_permissions, dispatch_uid='django.contrib.auth.management.create_permissions')
+    post_migrate.disconnect(create_contenttypes)
+
+
+class TestRunner(DiscoverRunner):
+
+    def setup_databases(self, **kwargs):
+        disconnect_post_migrate_handlers()
+        return super().setup_databases(**kwargs)
@@ -0,0 +1,47 @@
+"""
+Django test settings for mysite project.
+
+Extends the project settings with tweaks that only make sense for the test suite. Run the tests with:
+
+    ./manage.py test --settings=mysite.test_settings --parallel
+
+`--parallel` without a value starts one worker per CPU core, each with its own clone of the test
+database, so tests must not share state outside of the database.
+
+`pytest` picks these settings up from pytest.ini.
+"""
+
+from .settings import *  # noqa: F401,F403
+
+
+# The test runner forces DEBUG off anyway; state it here so it doesn't depend on the runner. Any
+# host is accepted so the client never trips over host validation.
+
+DEBUG = False
+
+ALLOWED_HOSTS = ['*']
+
+# Skips the ContentType and Permission rows normally created after the test database is set up.
+TEST_RUNNER = 'mysite.runner.TestRunner'
+
+
+# Database
+# Build the test schema straight from the models instead of replaying every migration.
+
+MIGRATION_MODULES = {
+    'admin': None,
+    'auth': None,
+    'contenttypes': None,
+    'sessions': None,
+    'polls': None,
+}
+
+# Always test against an in-memory SQLite database, whatever the project database is, so no
+# transaction ever touches the disk.
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
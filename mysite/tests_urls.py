@@ -0,0 +1,10 @@
+from django.http import HttpResponseNotFound
+
+from .urls import urlpatterns  # noqa: F401
+
+
+def handler404(request, exception=None):
+    """
+    Return a bare 404 so tests that only check the status code skip loading and rendering a template.
+    """
+    return HttpResponseNotFound(b'')
@@ -1,24 +1,52 @@
 import datetime
+from functools import lru_cache
+from unittest import mock
 
-from django.test import TestCase
+from django.db import connection
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.utils import timezone
 from django.urls import reverse
 
 from django.contrib.auth import get_user_model
-from django.contrib.auth.models import User
-from django.test.client import Client
 
-from .models import Question
+from .models import Choice, Question
 
 
-class QuestionModelTests(TestCase):
+User = get_user_model()
+
+_EPOCH = timezone.now()
+
+# Just enough middleware for the views to resolve request.user; CSRF, messages, clickjacking and
+# security middleware are skipped.
+MINIMAL_MIDDLEWARE = [
+    'django.contrib.sessions.middleware.SessionMiddleware',
+    'django.middleware.common.CommonMiddleware',
+    'django.contrib.auth.middleware.AuthenticationMiddleware',
+]
+
+
+@lru_cache(maxsize=None)
+def _index_url():
+    return reverse('polls:index')
+
+
+class QuestionModelTests(SimpleTestCase):
+    databases = set()
+    now = _EPOCH
+
+    def setUp(self):
+        # Freeze the clock was_published_recently() reads, so the one-second margins in these tests
+        # are measured against the same instant as the pub_dates.
+        patcher = mock.patch('django.utils.timezone.now', return_value=self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
 
     def test_was_published_recently_with_future_question(self):
         """ 
         was_published_recently() returns False for questions whose
         pub_date is in the future.
         """
-        time = timezone.now() + datetime.timedelta(days=30)
+        time = self.now + datetime.timedelta(days=30)
         future_question = Question(pub_date=time)
         self.assertIs(future_question.was_published_recently(), False)
 
@@ -26,7 +54,7 @@ class QuestionModelTests(TestCase):
         """
         was_published_recently() returns False for questions whose pub_date is older than 1 day.
         """
-        time = timezone.now() - datetime.timedelta(days=1, seconds=1)
+        time = self.now - datetime.timedelta(days=1, seconds=1)
         old_question = Question(pub_date=time)
 
         self.assertIs(old_question.was_published_recently(), False)
@@ -35,29 +63,54 @@ class QuestionModelTests(TestCase):
         """
         was_published_recently() returns True for questions whose pub_date is within the last day.
         """
-        time = timezone.now() - datetime.timedelta(hours=23, minutes=59, seconds=59)
+        time = self.now - datetime.timedelta(hours=23, minutes=59, seconds=59)
         recent_question = Question(pub_date=time)
 
         self.assertIs(recent_question.was_published_recently(), True)
 
 
-def create_question(question_text, days):
+def create_question(question_text, days, now=_EPOCH):
     """
     Create a question with the given `question_text` and published the given number of `days` offset
-    to now (negative for questions published in the past, positive for questions that have yet to be 
+    to `now` (negative for questions published in the past, positive for questions that have yet to be 
     published).
     """
-    time = timezone.now() + datetime.timedelta(days=days)
+    time = now + datetime.timedelta(days=days)
 
     return Question.objects.create(question_text=question_text, pub_date=time)
 
 
+def create_questions_bulk(specs, now=_EPOCH):
+    """
+    Create a question for each `(question_text, days)` pair in `specs`, each with a single choice,
+    using one bulk insert per model where the database backend allows it.
+    """
+    questions = [
+        Question(question_text=question_text, pub_date=now + datetime.timedelta(days=days))
+        for question_text, days in specs
+    ]
+    if connection.features.can_return_rows_from_bulk_insert:
+        Question.objects.bulk_create(questions)
+    else:
+        # The choices need the questions' primary keys, which this backend can't return from a
+        # bulk insert.
+        for q in questions:
+            q.save()
+
+    Choice.objects.bulk_create([
+        Choice(question=q, choice_text='Choice for %s' % q.question_text, votes=0)
+        for q in questions
+    ])
+
+    return questions
+
+
 class QuestionIndexViewTests(TestCase):
     def test_no_questions(self):
         """
         If no questions exist, an appropriate message is displayed.
         """
-        response = self.client.get(reverse('polls:index'))
+        response = self.client.get(_index_url())
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, "No polls are available.")
         self.assertQuerysetEqual(response.context['latest_question_list'], [])
@@ -70,10 +123,11 @@ class QuestionIndexViewTests(TestCase):
 
         q.choice_set.create(choice_text='Choice for Past question.', votes=0) 
 
-        response = self.client.get(reverse('polls:index'))
+        response = self.client.get(_index_url())
         self.assertQuerysetEqual(
-            response.context['latest_question_list'], 
-            ['<Question: Past question.>']
+            response.context['latest_question_list'],
+            ['Past question.'],
+            transform=str,
         )
 
     def test_future_question_with_choice(self):
@@ -85,7 +139,7 @@ class QuestionIndexViewTests(TestCase):
 
         q.choice_set.create(choice_text='Choice for Future question.', votes=0)
 
-        response = self.client.get(reverse('polls:index'))
+        response = self.client.get(_index_url())
         self.assertContains(response, "No polls are available.")
         self.assertQuerysetEqual(
             response.context['latest_question_list'], 
@@ -96,32 +150,26 @@ class QuestionIndexViewTests(TestCase):
         """
         Even if both past and future questions exist with choices, only past questions are displayed.
         """
-        q1 = create_question(question_text="Past question.", days=-30)
-        q2 = create_question(question_text="Future question.", days=30)
+        create_questions_bulk([("Past question.", -30), ("Future question.", 30)])
 
-        q1.choice_set.create(choice_text='Choice for Past question.', votes=0)
-        q2.choice_set.create(choice_text='Choice for Future question.', votes=0)
-
-        response = self.client.get(reverse('polls:index'))
+        response = self.client.get(_index_url())
         self.assertQuerysetEqual(
             response.context['latest_question_list'],
-            ['<Question: Past question.>']
+            ['Past question.'],
+            transform=str,
         )
 
     def test_two_past_questions_with_choice(self):
         """
         The questions index page may display multiple questions that have choices.
         """
-        q1 = create_question(question_text="Past question 1.", days=-30)
-        q2 = create_question(question_text="Past question 2.", days=-5)
-
-        q1.choice_set.create(choice_text='Choice for Past question 1.', votes=0)
-        q2.choice_set.create(choice_text='Choice for Past question 2.', votes=0)
+        create_questions_bulk([("Past question 1.", -30), ("Past question 2.", -5)])
 
-        response = self.client.get(reverse('polls:index'))
+        response = self.client.get(_index_url())
         self.assertQuerysetEqual(
             response.context['latest_question_list'],
-            ['<Question: Past question 2.>', '<Question: Past question 1.>']
+            ['Past question 2.', 'Past question 1.'],
+            transform=str,
         )
     
     def test_past_question_without_choice(self):
@@ -129,7 +177,7 @@ class QuestionIndexViewTests(TestCase):
         Questions without choices should not be published.
         """
         create_question(question_text="Question without choices", days=-30)
-        response = self.client.get(reverse('polls:index'))
+        response = self.client.get(_index_url())
         self.assertContains(response, "No polls are available.")
         self.assertQuerysetEqual(
             response.context['latest_question_list'], 
@@ -137,51 +185,43 @@ class QuestionIndexViewTests(TestCase):
         )
 
 
-class QuestionDetailViewTests(TestCase):
-    def test_future_question(self):
-        """
-        The detail view of a question with a pub_date in the future returns 404 not found.
-        """
-        future_question = create_question(question_text='Future question.', days=5)
-        url = reverse('polls:detail', args=(future_question.id,))
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, 404)
-
-    def test_past_question(self):
-        """
-        The detail view of a question with a pub_date in the past displays the question's text.
-        """
-        past_question = create_question(question_text='Past Question.', days=-5)
-        url = reverse('polls:detail', args=(past_question.id,))
-        response = self.client.get(url)
-        self.assertContains(response, past_question.question_text)
+class QuestionDetailAndResultsViewTests(TestCase):
+    view_names = ('polls:detail', 'polls:results')
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.future_question = create_question(question_text='Future question.', days=5)
+        cls.past_question = create_question(question_text='Past Question.', days=-5)
 
-class QuestionResultsViewTests(TestCase):
+    @override_settings(ROOT_URLCONF='mysite.tests_urls')
     def test_future_question(self):
         """
-        The results view of a question with a pub_date in the future returns 404 not found.
+        The detail and results views of a question with a pub_date in the future return 404 not found.
         """
-        future_question = create_question(question_text='Future question.', days=5)
-        url = reverse('polls:results', args=(future_question.id,))
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, 404)
+        for view_name in self.view_names:
+            with self.subTest(view=view_name):
+                response = self.client.get(reverse(view_name, args=(self.future_question.id,)))
+                self.assertEqual(response.status_code, 404)
 
     def test_past_question(self):
         """
-        The results view of a question with a pub_date in the past displays the question's text.
+        The detail and results views of a question with a pub_date in the past display the question's
+        text.
         """
-        past_question = create_question(question_text='Past Question.', days=-5)
-        url = reverse('polls:results', args=(past_question.id,))
-        response = self.client.get(url)
-        self.assertContains(response, past_question.question_text)
+        for view_name in self.view_names:
+            with self.subTest(view=view_name):
+                response = self.client.get(reverse(view_name, args=(self.past_question.id,)))
+                self.assertContains(response, self.past_question.question_text)
 
 
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
 class AdminTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser = User.objects.create_superuser(username='admin', password='adminpassword')
+
     def setUp(self):
-        self.superuser = get_user_model().objects.create_superuser(username='admin', password='adminpassword')
-        self.superuser.save()
-    
+        self.client.force_login(self.superuser)
 
     def test_superuser_can_see_future_question_with_choice(self):
         """
@@ -192,13 +232,12 @@ class AdminTests(TestCase):
 
         q.choice_set.create(choice_text="Choice for Future question.", votes=0)
 
-        self.client.force_login(self.superuser)
-
-        response = self.client.get(reverse('polls:index'))
+        response = self.client.get(_index_url())
 
         self.assertQuerysetEqual(
             response.context['latest_question_list'],
-            ['<Question: Future question.>']
+            ['Future question.'],
+            transform=str,
         )
 
 
@@ -208,22 +247,24 @@ class AdminTests(TestCase):
         """
 
         create_question(question_text='Past question.', days=-30)
-        
-        self.client.force_login(self.superuser)
 
-        response = self.client.get(reverse('polls:index'))
+        response = self.client.get(_index_url())
 
         self.assertQuerysetEqual(
             response.context['latest_question_list'],
-            ['<Question: Past question.>']
+            ['Past question.'],
+            transform=str,
         )
 
 
+@override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'])
 class LoggedUserTests(TestCase):
-    def setUp(self):
-        self.user = get_user_model().objects.create_user(username='user', password='userpassword')
-        self.user.save()
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='user', password='userpassword')
 
+    def setUp(self):
+        self.client.force_login(self.user)
 
     def test_logged_user_can_see_future_question_with_choice(self):
         """
@@ -234,9 +275,7 @@ class LoggedUserTests(TestCase):
 
         q.choice_set.create(choice_text="Choice for Future question.", votes=0)
 
-        self.client.force_login(self.user)
-
-        response = self.client.get(reverse('polls:index'))
+        response = self.client.get(_index_url())
 
         self.assertQuerysetEqual(
             response.context['latest_question_list'],
@@ -251,9 +290,7 @@ class LoggedUserTests(TestCase):
 
         create_question(question_text="Past question.", days=-30)
 
-        self.client.force_login(self.user)
-
-        response = self.client.get(reverse('polls:index'))
+        response = self.client.get(_index_url())
 
         self.assertQuerysetEqual(
             response.context['latest_question_list'], 
@@ -261,6 +298,7 @@ class LoggedUserTests(TestCase):
         )
 
 
+@override_settings(MIDDLEWARE=MINIMAL_MIDDLEWARE)
 class AnonymousUserTests(TestCase):
     def test_ordinary_user_can_see_future_question_with_choice(self):
         """
@@ -271,7 +309,7 @@ class AnonymousUserTests(TestCase):
 
         q.choice_set.create(choice_text="Choice for Future question.", votes=0)
 
-        response = self.client.get(reverse('polls:index'))
+        response = self.client.get(_index_url())
 
         self.assertQuerysetEqual(
             response.context['latest_question_list'], 
@@ -285,7 +323,7 @@ class AnonymousUserTests(TestCase):
 
         create_question(question_text="Past question.", days=-30)
 
-        response = self.client.get(reverse('polls:index'))
+        response = self.client.get(_index_url())
 
         self.assertQuerysetEqual(
             response.context['latest_question_list'], 